@@ -1,7 +1,7 @@
 """Artifactory-specific helpers.
 
 Conan's remote API doesn't expose artifact sizes, but every remote is a Conan
-repository on the configured Artifactory host (see config.ARTIFACTORY_URL).
+repository on the configured Artifactory host (see config.settings.artifactory_url).
 Artifactory's AQL API lets us sum the on-disk size of each package binary.
 Best-effort: any failure (unknown remote, auth, network) yields an empty map and
 the caller treats sizes as unknown.
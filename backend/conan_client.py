@@ -6,11 +6,17 @@ Access it via this module's attribute (e.g. `conan_client.get_optional_api()`),
 never `from conan_client import conan_api`, which would bind `None` at import.
 """
 
+import asyncio
+import functools
 import logging
+import sys
 
+from cachetools import TTLCache
 from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
 from conan.api.conan_api import ConanAPI
 from conan.api.model import Remote, ListPattern, RecipeReference, PkgReference
+from conan.errors import ConanException
 
 import config
 import credentials
@@ -25,13 +31,44 @@ conan_api = None
 # Conan home by other means.
 _managed_remotes = set()
 
+# Bumped by every sync_remotes run, so responses derived from the remote setup
+# (see routers.meta) know when a cached copy is out of date.
+remotes_version = 0
 
-def get_remote_by_name(conan_api: ConanAPI, name: str):
-    """Get a remote by name."""
+# (remotes_version, conan_api, remotes) for get_supported_remotes
+_supported_remotes_snapshot = None
+
+
+@functools.lru_cache(maxsize=16)
+def _lookup_remote(conan_api: ConanAPI, name: str):
+    """Memoized `remotes.get`, which re-reads remotes.json on every call."""
     try:
         return conan_api.remotes.get(name)
-    except Exception:
+    except ConanException:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _list_remotes(conan_api: ConanAPI):
+    """Memoized `remotes.list`, for the same reason as _lookup_remote."""
+    return tuple(conan_api.remotes.list())
+
+
+def _clear_remote_caches():
+    """Forget memoized remote lookups after the remote registry changed."""
+    _lookup_remote.cache_clear()
+    _list_remotes.cache_clear()
+
+
+def get_remote_by_name(conan_api: ConanAPI, name: str):
+    """Get a remote by name.
+
+    Lookups are cached; sync_remotes clears the cache whenever it changes the
+    remote registry, so a remote it adds, updates or removes is seen at once.
+    """
+    if not name or conan_api is None:
         return None
+    return _lookup_remote(conan_api, name)
 
 
 def sync_remotes():
@@ -41,8 +78,9 @@ def sync_remotes():
     list of per-remote warning strings; a remote that fails to configure is
     reported but does not stop the others.
     """
-    global _managed_remotes
+    global _managed_remotes, remotes_version
 
+    remotes_version += 1
     warnings = []
     if conan_api is None:
         return ["Conan API is not available"]
@@ -51,6 +89,8 @@ def sync_remotes():
         logger.warning("No repositories configured - application may have limited functionality")
 
     configured_names = set()
+    # Pick up remotes edited outside the app since the last sync
+    _clear_remote_caches()
 
     for repo_config in config.REPOSITORIES:
         repo_name = repo_config.get("name")
@@ -70,10 +110,12 @@ def sync_remotes():
                 # Add the remote
                 remote = Remote(repo_name, repo_url)
                 conan_api.remotes.add(remote)
+                _clear_remote_caches()
                 logger.info(f"Added remote '{repo_name}' at {repo_url}")
             elif existing_remote.url != repo_url:
                 # Update URL if different
                 conan_api.remotes.update(repo_name, url=repo_url)
+                _clear_remote_caches()
                 logger.info(f"Updated remote '{repo_name}' URL to {repo_url}")
 
             _managed_remotes.add(repo_name)
@@ -109,6 +151,7 @@ def sync_remotes():
         try:
             if get_remote_by_name(conan_api, stale_name):
                 conan_api.remotes.remove(stale_name)
+                _clear_remote_caches()
                 logger.info(f"Removed remote '{stale_name}' (no longer in config)")
         except Exception as e:
             warnings.append(f"Failed to remove remote '{stale_name}': {e}")
@@ -123,7 +166,7 @@ def initialize_conan_api():
     global conan_api
 
     try:
-        conan_api = ConanAPI(cache_folder=config.CONAN_HOME)
+        conan_api = ConanAPI(cache_folder=config.settings.conan_home)
         logger.info("Conan API initialized successfully")
         sync_remotes()
     except Exception as e:
@@ -147,33 +190,48 @@ def get_optional_api():
 
 
 def get_all_remotes():
-    """Get all configured remotes."""
+    """Get all configured remotes.
+
+    Cached like get_remote_by_name and cleared by the same sync_remotes steps.
+    """
+    if conan_api is None:
+        return []
     try:
-        return conan_api.remotes.list()
-    except Exception:
+        return list(_list_remotes(conan_api))
+    except ConanException:
         return []
 
 
-def validate_remote_name(conan_api: ConanAPI, remote_name: str) -> str:
-    """Validate and return a supported remote name."""
+def validate_remote_name(conan_api: ConanAPI, remote_name: str) -> Remote:
+    """Validate a supported remote name and return its Conan Remote."""
     if not remote_name:
         raise HTTPException(status_code=400, detail="Remote name is required")
 
-    if remote_name not in config.AVAILABLE_REMOTES:
+    if remote_name not in config.AVAILABLE_REMOTES_SET:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported remote '{remote_name}'. Available remotes: {', '.join(config.AVAILABLE_REMOTES)}",
+            detail=f"Unsupported remote '{remote_name}'. Available remotes: {config.AVAILABLE_REMOTES_STR}",
         )
 
     remote = get_remote_by_name(conan_api, remote_name)
     if not remote:
         raise HTTPException(status_code=404, detail=f"Remote '{remote_name}' not found in Conan configuration")
 
-    return remote_name
+    return remote
 
 
 def get_supported_remotes(conan_api: ConanAPI):
-    """Get list of supported remotes with their configuration."""
+    """Get list of supported remotes with their configuration.
+
+    The list only changes when sync_remotes runs, so it is built once per sync
+    (and Conan API instance) and shared afterwards; callers must not mutate it.
+    """
+    global _supported_remotes_snapshot
+
+    snapshot = _supported_remotes_snapshot
+    if snapshot is not None and snapshot[0] == remotes_version and snapshot[1] is conan_api:
+        return snapshot[2]
+
     remotes = []
     for remote_name in config.AVAILABLE_REMOTES:
         remote = get_remote_by_name(conan_api, remote_name)
@@ -181,6 +239,7 @@ def get_supported_remotes(conan_api: ConanAPI):
             remotes.append({"name": remote.name, "url": remote.url, "available": True})
         else:
             remotes.append({"name": remote_name, "url": None, "available": False})
+    _supported_remotes_snapshot = (remotes_version, conan_api, remotes)
     return remotes
 
 
@@ -193,6 +252,17 @@ def get_supported_remotes(conan_api: ConanAPI):
 # `.items()` method directly at the call sites.
 
 
+@functools.lru_cache(maxsize=512)
+def make_list_pattern(expression: str, rrev="latest", package_id=None, prev="latest",
+                      only_recipe=False) -> ListPattern:
+    """Cached ListPattern constructor; the UI repeats the same queries while paging.
+
+    Conan only reads a pattern, never modifies it, so one instance is shared by
+    every caller with the same arguments. Treat the result as read-only.
+    """
+    return ListPattern(expression, rrev=rrev, package_id=package_id, prev=prev, only_recipe=only_recipe)
+
+
 def search_recipes(conan_api: ConanAPI, query: str, remote=None):
     """Search a remote for recipe references matching `query`.
 
@@ -207,7 +277,7 @@ def search_recipes(conan_api: ConanAPI, query: str, remote=None):
 
     # only_recipe: parse just the recipe part; select then returns a recipe-only
     # PackagesList whose keys are the matching references.
-    pattern = ListPattern(query, rrev=None, only_recipe=True)
+    pattern = make_list_pattern(query, rrev=None, only_recipe=True)
     package_list = conan_api.list.select(pattern, remote=remote)
 
     refs = [RecipeReference.loads(ref_str) for ref_str in package_list.serialize().keys()]
@@ -226,7 +296,7 @@ def get_package_configurations(conan_api: ConanAPI, ref: RecipeReference, remote
     """
     assert ref.revision is not None, "get_package_configurations: ref should have a revision"
 
-    pattern = ListPattern(f"{ref.repr_notime()}:*", prev=None)
+    pattern = make_list_pattern(f"{ref.repr_notime()}:*", prev=None)
     package_list = conan_api.list.select(pattern, remote=remote)
 
     result = {}
@@ -234,5 +304,135 @@ def get_package_configurations(conan_api: ConanAPI, ref: RecipeReference, remote
         for rrev, rrev_data in ref_data.get("revisions", {}).items():
             recipe = RecipeReference.loads(f"{ref_str}#{rrev}")
             for package_id, package_data in rrev_data.get("packages", {}).items():
-                result[PkgReference(recipe, package_id)] = package_data.get("info", {})
+                result[PkgReference(recipe, package_id)] = _package_info(package_data)
+    return result
+
+
+def _package_info(package_data):
+    """The "info" of one serialized PackagesList binary, settings interned."""
+    info = package_data.get("info", {})
+    settings = info.get("settings")
+    if settings:
+        # The same few setting names/values repeat across every binary kept in
+        # the caches; share them
+        info["settings"] = {
+            sys.intern(k): sys.intern(v) if isinstance(v, str) else v
+            for k, v in settings.items()
+        }
+    return info
+
+
+def list_recipe_revisions(conan_api: ConanAPI, package_name: str, version: str, remote=None,
+                          rrev="latest"):
+    """Return the recipe revisions of `package_name/version` for every user/channel.
+
+    Only the latest revision of each by default; pass rrev="*" for all of them.
+    Binaries are not listed; see list_package_revisions for those.
+    """
+    pattern = make_list_pattern(f"{package_name}/{version}@*", rrev=rrev)
+    package_list = conan_api.list.select(pattern, remote=remote)
+    return [ref for ref, _packages_info in package_list.items()]
+
+
+def list_package_revisions(conan_api: ConanAPI, ref: RecipeReference, remote=None, package_query=None):
+    """Return {PkgReference: info} for every package revision of recipe revision `ref`.
+
+    Unlike get_package_configurations the keys carry package revisions and
+    timestamps. `info` is the binary's settings/options/requires from the same
+    listing, read from serialize() since PackagesList.items() leaves it out.
+    `package_query` ("os=Linux AND arch=x86_64") is applied by Conan before it
+    lists package revisions, so filtered-out binaries cost no extra requests.
+    """
+    assert ref.revision is not None, "list_package_revisions: ref should have a revision"
+
+    pattern = make_list_pattern(f"{ref.repr_notime()}:*#*")
+    package_list = conan_api.list.select(pattern, package_query=package_query, remote=remote)
+
+    result = {}
+    for ref_data in package_list.serialize().values():
+        for rrev_data in ref_data.get("revisions", {}).values():
+            for package_id, package_data in rrev_data.get("packages", {}).items():
+                info = _package_info(package_data)
+                for prev, prev_data in package_data.get("revisions", {}).items():
+                    result[PkgReference(ref, package_id, prev, prev_data.get("timestamp"))] = info
     return result
+
+
+# Binary configurations per recipe revision, keyed on (remote name, rref). Each
+# miss is a remote round-trip, and the binaries views re-request the same
+# revisions on every visit, so results are kept for a few minutes. Cleanup
+# clears the cache after deleting anything.
+_configurations_cache = TTLCache(maxsize=1024, ttl=300)
+# Recipe and package revision listings for the binaries view. Unlike
+# configurations these change whenever something is uploaded, so they are only
+# kept long enough to absorb the burst of requests one page of the UI makes.
+_listings_cache = TTLCache(maxsize=512, ttl=30)
+# One lock per key in flight, so concurrent requests for the same entry share a
+# single fetch instead of each going to the remote.
+_inflight_locks = {}
+
+
+async def _cached_fetch(cache: TTLCache, key, func, *args):
+    """Return cache[key], filling it with func(*args) run off the event loop."""
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    lock_key = (id(cache), key)
+    lock = _inflight_locks.setdefault(lock_key, asyncio.Lock())
+    try:
+        async with lock:
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            result = await run_in_threadpool(func, *args)
+            cache[key] = result
+            return result
+    finally:
+        # A later request may have already replaced the entry with its own lock
+        if _inflight_locks.get(lock_key) is lock:
+            del _inflight_locks[lock_key]
+
+
+async def get_cached_package_configurations(conan_api: ConanAPI, ref: RecipeReference, remote=None):
+    """`get_package_configurations`, cached and run off the event loop."""
+    key = (remote.name if remote else None, ref.repr_notime())
+    return await _cached_fetch(_configurations_cache, key, get_package_configurations, conan_api, ref, remote)
+
+
+async def get_cached_recipe_revisions(conan_api: ConanAPI, package_name: str, version: str, remote=None,
+                                      rrev="latest"):
+    """`list_recipe_revisions`, cached briefly and run off the event loop."""
+    key = ("recipes", remote.name if remote else None, package_name, version, rrev)
+    return await _cached_fetch(
+        _listings_cache, key, list_recipe_revisions, conan_api, package_name, version, remote, rrev
+    )
+
+
+async def get_cached_package_revisions(conan_api: ConanAPI, ref: RecipeReference, remote=None,
+                                       package_query=None):
+    """`list_package_revisions`, cached briefly and run off the event loop."""
+    remote_name = remote.name if remote else None
+    key = ("packages", remote_name, ref.repr_notime(), package_query)
+    packages_info = await _cached_fetch(
+        _listings_cache, key, list_package_revisions, conan_api, ref, remote, package_query
+    )
+    # Listings expire much sooner than configurations. A cached configurations
+    # entry missing one of these binaries predates their upload, so drop it and
+    # let the next reader (e.g. the filter options) fetch it again.
+    if packages_info:
+        configs_key = (remote_name, ref.repr_notime())
+        configs = _configurations_cache.get(configs_key)
+        if configs is not None:
+            cached_ids = {pref.package_id for pref in configs}
+            if any(pref.package_id not in cached_ids for pref in packages_info):
+                _configurations_cache.pop(configs_key, None)
+    return packages_info
+
+
+def clear_package_caches():
+    """Drop every cached configuration and listing (after binaries were added or removed)."""
+    _configurations_cache.clear()
+    _listings_cache.clear()
@@ -15,6 +15,7 @@ Credentials deliberately do not live here; see `credentials.py`.
 
 import os
 import logging
+from dataclasses import dataclass
 
 from dotenv import load_dotenv
 
@@ -25,22 +26,59 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Optional: specify custom Conan home
-CONAN_HOME = os.getenv("CONAN_HOME")
 
-# Server configuration
-BACKEND_PORT = int(os.getenv("BACKEND_PORT", "8000"))
-# Backend always binds to all interfaces in container for nginx proxy access
-BACKEND_HOST = "0.0.0.0"
+@dataclass(frozen=True)
+class Settings:
+    """Snapshot of the backend's configuration variables.
 
-# CORS origins (comma-separated)
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    Built once at import (after load_dotenv) and never re-read; the rest of the
+    app reads attributes off `settings` instead of calling os.getenv. Credentials
+    are the exception and stay in `credentials.py`.
+    """
 
-# Base Artifactory host, e.g. https://your-artifactory.com (no trailing path)
-ARTIFACTORY_URL = os.getenv("ARTIFACTORY_URL", "").strip().rstrip("/")
+    # Optional: specify custom Conan home
+    conan_home: str | None
+    # Server configuration
+    backend_port: int
+    # Auto-reload for local development; the container turns it off
+    backend_reload: bool
+    # uvicorn worker processes when not reloading; each keeps its own caches
+    backend_workers: int
+    # CORS origins (comma-separated in the environment, whitespace ignored)
+    cors_origins: tuple[str, ...]
+    # Optional regex matching allowed origins (e.g. every *.dev.example.com
+    # host); when set it replaces the CORS_ORIGINS list
+    cors_origin_regex: str | None
+    # Base Artifactory host, e.g. https://your-artifactory.com (no trailing path)
+    artifactory_url: str
+    # Comma-separated Conan repository names on that host; the first is the default
+    conan_remotes: str
+    # Legacy config file location, only checked to warn that it is ignored
+    legacy_config_path: str | None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            conan_home=os.getenv("CONAN_HOME"),
+            backend_port=int(os.getenv("BACKEND_PORT", "8000")),
+            backend_reload=os.getenv("BACKEND_RELOAD", "true").lower() in ("1", "true", "yes"),
+            backend_workers=max(1, int(os.getenv("BACKEND_WORKERS", "1"))),
+            cors_origins=tuple(
+                origin.strip()
+                for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+                if origin.strip()
+            ),
+            cors_origin_regex=os.getenv("CORS_ORIGIN_REGEX") or None,
+            artifactory_url=os.getenv("ARTIFACTORY_URL", "").strip().rstrip("/"),
+            conan_remotes=os.getenv("CONAN_REMOTES", ""),
+            legacy_config_path=os.getenv("CONAN_UI_CONFIG"),
+        )
+
+
+settings = Settings.from_env()
 
-# Comma-separated Conan repository names on that host; the first is the default
-CONAN_REMOTES = os.getenv("CONAN_REMOTES", "")
+# Backend always binds to all interfaces in container for nginx proxy access
+BACKEND_HOST = "0.0.0.0"
 
 # Artifactory always serves Conan repositories under this path
 CONAN_PATH = "/artifactory/api/conan"
@@ -48,12 +86,12 @@ CONAN_PATH = "/artifactory/api/conan"
 
 def remote_url(name: str) -> str:
     """Full Conan remote URL for a repository name on the configured host."""
-    return f"{ARTIFACTORY_URL}{CONAN_PATH}/{name}"
+    return f"{settings.artifactory_url}{CONAN_PATH}/{name}"
 
 
 def artifactory_api_base() -> str:
     """Base URL for Artifactory's own REST API (not the Conan endpoint)."""
-    return f"{ARTIFACTORY_URL}/artifactory"
+    return f"{settings.artifactory_url}/artifactory"
 
 
 def load_repositories():
@@ -63,16 +101,17 @@ def load_repositories():
     CONAN_REMOTES. Misconfiguration is logged and yields an empty list rather
     than raising, so the app still starts and reports itself unconfigured.
     """
-    names = [name.strip() for name in CONAN_REMOTES.split(",") if name.strip()]
+    artifactory_url = settings.artifactory_url
+    names = [name.strip() for name in settings.conan_remotes.split(",") if name.strip()]
 
     if not names:
         logger.warning("CONAN_REMOTES is empty - no repositories configured")
         return []
-    if not ARTIFACTORY_URL:
+    if not artifactory_url:
         logger.error("ARTIFACTORY_URL is not set - cannot build remote URLs")
         return []
-    if not ARTIFACTORY_URL.startswith(("http://", "https://")):
-        logger.error(f"ARTIFACTORY_URL must start with http:// or https:// (got '{ARTIFACTORY_URL}')")
+    if not artifactory_url.startswith(("http://", "https://")):
+        logger.error(f"ARTIFACTORY_URL must start with http:// or https:// (got '{artifactory_url}')")
         return []
 
     seen = set()
@@ -95,8 +134,7 @@ def load_repositories():
 
 def _warn_obsolete_config_file():
     """Point out a leftover config.json, which is no longer read."""
-    legacy_path = os.getenv("CONAN_UI_CONFIG")
-    for path in filter(None, [legacy_path, "config.json", "/etc/conan-ui/config.json"]):
+    for path in filter(None, [settings.legacy_config_path, "config.json", "/etc/conan-ui/config.json"]):
         if os.path.exists(path):
             logger.warning(
                 f"Found '{path}', which is no longer used. Configuration now comes from "
@@ -109,5 +147,9 @@ def _warn_obsolete_config_file():
 _warn_obsolete_config_file()
 
 REPOSITORIES = load_repositories()
-AVAILABLE_REMOTES = [repo["name"] for repo in REPOSITORIES]
+AVAILABLE_REMOTES = tuple(repo["name"] for repo in REPOSITORIES)
+# Hashed membership test for per-request remote validation, and the list it
+# reports when a name is rejected
+AVAILABLE_REMOTES_SET = frozenset(AVAILABLE_REMOTES)
+AVAILABLE_REMOTES_STR = ", ".join(AVAILABLE_REMOTES)
 DEFAULT_REMOTE = AVAILABLE_REMOTES[0] if AVAILABLE_REMOTES else None
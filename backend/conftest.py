@@ -0,0 +1,29 @@
+"""Shared pytest fixtures for the backend tests.
+
+The Conan fixtures are session-scoped: building a ConanAPI and listing the cache
+are the slow parts, and the tests only read from them.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def conan_api(tmp_path_factory):
+    """A ConanAPI on a throwaway Conan home, so tests never touch the real one."""
+    pytest.importorskip("conan")
+    from conan.api.conan_api import ConanAPI
+
+    return ConanAPI(cache_folder=str(tmp_path_factory.mktemp("conan_home")))
+
+
+@pytest.fixture(scope="session")
+def remotes(conan_api):
+    return conan_api.remotes.list()
+
+
+@pytest.fixture(scope="session")
+def package_list(conan_api):
+    """Recipe-only listing of the local cache (no remote is queried)."""
+    from conan.api.model import ListPattern
+
+    return conan_api.list.select(ListPattern("*", rrev=None, prev=None), remote=None)
@@ -13,10 +13,10 @@ remote helpers in `conan_client`, request/response models in `schemas`, and the
 endpoints in the `routers` package.
 """
 
-import os
 import logging
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -26,11 +26,18 @@ from routers import meta, packages, cleanup
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for blocking Conan calls (anyio's default is 40)
+THREADPOOL_SIZE = 64
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage FastAPI lifespan events"""
     # Startup
+    # Every Conan call runs in the worker thread pool (endpoints are async), so
+    # its size caps how many requests can be talking to a remote at once.
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
     logger.info("Starting up - initializing Conan API...")
     conan_client.initialize_conan_api()
     if conan_client.get_optional_api():
@@ -52,10 +59,12 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS configuration
+# CORS configuration. A CORS_ORIGIN_REGEX, when set, is matched instead of the
+# CORS_ORIGINS list: one pattern covers a whole family of hosts.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=config.CORS_ORIGINS,
+    allow_origins=() if config.settings.cors_origin_regex else config.settings.cors_origins,
+    allow_origin_regex=config.settings.cors_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -75,12 +84,15 @@ if __name__ == "__main__":
     # Defaults on for `python main.py` during development; the container bakes
     # source into the image and sets BACKEND_RELOAD=false, so production runs a
     # single process (and skips a watcher that could never fire on immutable
-    # source).
-    reload = os.getenv("BACKEND_RELOAD", "true").lower() in ("1", "true", "yes")
+    # source). Without reload, BACKEND_WORKERS can add worker processes; each
+    # one initializes its own Conan API and caches. uvicorn[standard] brings
+    # uvloop and httptools, which uvicorn's "auto" loop/http settings pick up.
+    reload = config.settings.backend_reload
     uvicorn.run(
         "main:app",
         host=config.BACKEND_HOST,
-        port=config.BACKEND_PORT,
+        port=config.settings.backend_port,
         reload=reload,
+        workers=1 if reload else config.settings.backend_workers,
         log_level="info",
     )
@@ -16,20 +16,26 @@ can report progress and match recipe names as substrings (e.g. "admin" matches
 "admin_panel").
 """
 
-import json
 import time
 import logging
 from typing import List, Dict
 
 from fastapi import APIRouter, HTTPException, Depends, Request
+from pydantic_core import to_json
 from fastapi.responses import StreamingResponse
 from starlette.concurrency import run_in_threadpool
 from conan.api.conan_api import ConanAPI
-from conan.api.model import ListPattern, RecipeReference, PkgReference
+from conan.api.model import RecipeReference, PkgReference
 from conan.errors import ConanException
 
 import artifactory
-from conan_client import get_conan_api, get_remote_by_name, validate_remote_name, search_recipes
+from conan_client import (
+    get_conan_api,
+    make_list_pattern,
+    validate_remote_name,
+    search_recipes,
+    clear_package_caches,
+)
 from schemas import (
     CleanupRequest,
     CleanupExecuteRequest,
@@ -54,9 +60,13 @@ DELETE_MODES = ("both", "binaries")
 _STREAM_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "no-cache"}
 
 
-def _nd(obj) -> str:
-    """Serialize one NDJSON line."""
-    return json.dumps(obj) + "\n"
+def _nd(obj) -> bytes:
+    """Serialize one NDJSON line.
+
+    Uses pydantic-core's Rust encoder, which also takes models directly, so
+    large payloads (a slot's groups) skip the model_dump + json.dumps round trip.
+    """
+    return to_json(obj) + b"\n"
 
 
 def _version_is_prerelease(version) -> bool:
@@ -129,7 +139,7 @@ def _collect_recipe_revisions(conan_api: ConanAPI, remote, req: CleanupRequest,
     binary-level scan used to skip entirely.
     """
     uc = f"@{recipe_ref.user}/{recipe_ref.channel}" if (recipe_ref.user or recipe_ref.channel) else ""
-    pattern = ListPattern(f"{recipe_ref.name}/{recipe_ref.version}{uc}:*", rrev="*", prev="*")
+    pattern = make_list_pattern(f"{recipe_ref.name}/{recipe_ref.version}{uc}:*", rrev="*", prev="*")
     package_list = conan_api.list.select(pattern, req.package_query, remote, lru=None)
 
     revisions = []
@@ -290,18 +300,17 @@ def _resolve_selection(items, req: CleanupExecuteRequest):
     Binaries whose recipe revision is also selected are skipped (the recipe
     removal already covers them).
     """
+    selected_recipes = set(req.delete_recipes)
     recipe_by_ref = {}
     bin_by_key = {}
-    for rref, binaries in items:
-        recipe_by_ref[rref.repr_notime()] = rref
-        for key, pref in binaries:
-            bin_by_key[key] = pref
-
-    selected_recipes = set(req.delete_recipes)
     # Which binary keys fall under a wholesale-removed recipe revision.
     covered_bins = set()
     for rref, binaries in items:
-        if rref.repr_notime() in selected_recipes:
+        ref_str = rref.repr_notime()
+        recipe_by_ref[ref_str] = rref
+        for key, pref in binaries:
+            bin_by_key[key] = pref
+        if ref_str in selected_recipes:
             covered_bins.update(key for key, _pref in binaries)
 
     targets = []
@@ -366,9 +375,8 @@ async def cleanup_preview(
     _validate_rules(req)
 
     try:
-        validate_remote_name(conan_api, req.remote_name)
-        remote = get_remote_by_name(conan_api, req.remote_name)
-        groups, summary, _dr, _db = compute_cleanup_plan(conan_api, remote, req)
+        remote = validate_remote_name(conan_api, req.remote_name)
+        groups, summary, _dr, _db = await run_in_threadpool(compute_cleanup_plan, conan_api, remote, req)
         return CleanupPlanResponse(remote_name=req.remote_name, groups=groups, summary=summary)
     except HTTPException:
         raise
@@ -389,11 +397,11 @@ async def cleanup_execute(
     _validate_rules(req)
 
     try:
-        validate_remote_name(conan_api, req.remote_name)
-        remote = get_remote_by_name(conan_api, req.remote_name)
+        remote = validate_remote_name(conan_api, req.remote_name)
 
-        items = _scan_items(conan_api, remote, req)
-        size_map = artifactory.get_binary_sizes(req.remote_name, _size_name_filter(req.pattern))
+        items = await run_in_threadpool(_scan_items, conan_api, remote, req)
+        size_map = await run_in_threadpool(
+            artifactory.get_binary_sizes, req.remote_name, _size_name_filter(req.pattern))
         by_bin, by_recipe = _selection_sizes(items, size_map)
         targets, _missing = _resolve_selection(items, req)
 
@@ -402,7 +410,11 @@ async def cleanup_execute(
         reclaimed = 0
         for kind, obj, key in targets:
             try:
-                _remove_target(conan_api, remote, kind, obj)
+                await run_in_threadpool(_remove_target, conan_api, remote, kind, obj)
+                # The browse views cache listings and binary configurations; don't
+                # serve deleted ones. Cleared here on the event loop rather than in
+                # _remove_target's worker thread: those caches are not thread-safe.
+                clear_package_caches()
                 deleted.append(key)
                 reclaimed += (by_recipe if kind == "recipe" else by_bin).get(key, 0)
             except Exception as e:
@@ -431,8 +443,9 @@ async def cleanup_execute(
 async def _stream_scan(conan_api, remote, req, request):
     """Async-generate scan progress events, returning collected items via a list.
 
-    Yields NDJSON strings; the "items" payload is a list of (rref, [(key, pref)])
-    recipe-revision tuples. Returns None if the client disconnected mid-scan.
+    Yields (kind, payload) pairs: ("event", one NDJSON line as bytes), then a
+    final ("items", list of (rref, [(key, pref)]) recipe-revision tuples), or
+    ("abort", None) if the client disconnected mid-scan.
     """
     recipes = await run_in_threadpool(_list_recipes, conan_api, remote, req)
     total = len(recipes)
@@ -489,8 +502,7 @@ async def cleanup_preview_stream(
       scan_start -> slot* -> (scan_progress / slot_ready)* -> done (or error)
     """
     _validate_rules(req)
-    validate_remote_name(conan_api, req.remote_name)
-    remote = get_remote_by_name(conan_api, req.remote_name)
+    remote = validate_remote_name(conan_api, req.remote_name)
 
     async def gen():
         try:
@@ -521,7 +533,7 @@ async def cleanup_preview_stream(
                 yield _nd({
                     "event": "slot_ready",
                     "id": slot_id,
-                    "groups": [g.model_dump() for g in groups],
+                    "groups": groups,
                 })
             yield _nd({"event": "done"})
         except Exception as e:
@@ -543,8 +555,7 @@ async def cleanup_execute_stream(
     further deletes; anything already removed stays removed.
     """
     _validate_rules(req)
-    validate_remote_name(conan_api, req.remote_name)
-    remote = get_remote_by_name(conan_api, req.remote_name)
+    remote = validate_remote_name(conan_api, req.remote_name)
 
     async def gen():
         try:
@@ -580,6 +591,8 @@ async def cleanup_execute_stream(
                     return
                 try:
                     await run_in_threadpool(_remove_target, conan_api, remote, kind, obj)
+                    # On the event loop, as in cleanup_execute
+                    clear_package_caches()
                     deleted += 1
                     reclaimed += (by_recipe if kind == "recipe" else by_bin).get(key, 0)
                     yield _nd({
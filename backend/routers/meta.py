@@ -1,22 +1,26 @@
 """Service metadata endpoints: root, health, repositories."""
 
+import hashlib
 import logging
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from pydantic_core import to_json
+from starlette.concurrency import run_in_threadpool
 from conan.api.conan_api import ConanAPI
 
 import config
+import conan_client
 from conan_client import get_conan_api, get_optional_api, get_supported_remotes
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# name -> ((remotes_version, api id), body, etag); see _cached_json
+_payload_cache = {}
 
-@router.get("/")
-async def root():
-    """Root endpoint - doesn't require Conan API to be available"""
-    conan_api = get_optional_api()
+
+def _build_root(conan_api):
     try:
         # Try to get configured remotes if API is available
         configured_remotes = 0
@@ -35,12 +39,55 @@ async def root():
     }
 
 
+def _build_repositories(conan_api):
+    repos = []
+    for remote_info in get_supported_remotes(conan_api):
+        repos.append({
+            "name": remote_info["name"],
+            "url": remote_info["url"] or "Not configured",
+            "available": remote_info["available"],
+            "description": f"Conan remote: {remote_info['name']}" + ("" if remote_info["available"] else " (Not configured)"),
+            "is_default": remote_info["name"] == config.DEFAULT_REMOTE,
+        })
+
+    return {
+        "repositories": repos,
+        "default": config.DEFAULT_REMOTE,
+    }
+
+
+async def _cached_json(request: Request, name: str, conan_api, build) -> Response:
+    """Serve a payload that only changes when the remotes are re-synced.
+
+    The serialized body and its ETag are kept until the next sync_remotes run
+    (or a different Conan API instance), and a client that already has the
+    current ETag gets an empty 304 instead.
+    """
+    key = (conan_client.remotes_version, id(conan_api))
+    cached = _payload_cache.get(name)
+    if cached is None or cached[0] != key:
+        body = to_json(await run_in_threadpool(build, conan_api))
+        etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+        cached = _payload_cache[name] = (key, body, etag)
+
+    _key, body, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@router.get("/")
+async def root(request: Request):
+    """Root endpoint - doesn't require Conan API to be available"""
+    return await _cached_json(request, "root", get_optional_api(), _build_root)
+
+
 @router.get("/health")
 async def health_check(conan_api: ConanAPI = Depends(get_conan_api)):
     """Health check endpoint"""
     try:
         # Test basic API functionality using the injected conan_api
-        remotes = conan_api.remotes.list()
+        remotes = await run_in_threadpool(conan_api.remotes.list)
         return {
             "status": "healthy",
             "conan_api": "available",
@@ -51,25 +98,10 @@ async def health_check(conan_api: ConanAPI = Depends(get_conan_api)):
 
 
 @router.get("/repositories")
-async def list_repositories(conan_api: ConanAPI = Depends(get_conan_api)):
+async def list_repositories(request: Request, conan_api: ConanAPI = Depends(get_conan_api)):
     """List available Conan remotes"""
     try:
-        supported_remotes = get_supported_remotes(conan_api)
-        repos = []
-
-        for remote_info in supported_remotes:
-            repos.append({
-                "name": remote_info["name"],
-                "url": remote_info["url"] or "Not configured",
-                "available": remote_info["available"],
-                "description": f"Conan remote: {remote_info['name']}" + ("" if remote_info["available"] else " (Not configured)"),
-                "is_default": remote_info["name"] == config.DEFAULT_REMOTE,
-            })
-
-        return {
-            "repositories": repos,
-            "default": config.DEFAULT_REMOTE,
-        }
+        return await _cached_json(request, "repositories", conan_api, _build_repositories)
     except Exception as e:
         logger.error(f"Repositories error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to list repositories: {str(e)}")
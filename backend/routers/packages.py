@@ -1,21 +1,31 @@
 """Package browsing endpoints: list, versions, configuration, binaries."""
 
+import asyncio
 import logging
 import os
+import re
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from starlette.concurrency import run_in_threadpool
 from conan.api.conan_api import ConanAPI
-from conan.api.model import ListPattern, RecipeReference
+from conan.api.model import RecipeReference
 from conan.errors import ConanException
 from conan.internal.errors import NotFoundException
+from conan.internal.model.version import Version
 
 from conan_client import (
     get_conan_api,
-    get_remote_by_name,
+    make_list_pattern,
     validate_remote_name,
     search_recipes,
-    get_package_configurations,
+    get_cached_package_configurations,
+    get_cached_package_revisions,
+    get_cached_recipe_revisions,
 )
 from schemas import (
     ConanPackageVariant,
@@ -34,6 +44,28 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Revision info for a version with no recipe revisions; shared by every empty
+# binaries response since nothing mutates it.
+_EMPTY_REVISION_INFO = ConanRevisionInfo(recipe_revisions=[], users=[], channels=[], latest_revision=None)
+
+# Per-request cap on concurrent remote fetches when a view needs data for
+# several recipe revisions at once.
+_REMOTE_FETCH_CONCURRENCY = 8
+
+# Setting values that can go into a Conan package query verbatim. Anything else
+# (quotes, "!", spaces that could spell AND/OR, the "None" wildcard) would change
+# the query's meaning or make Conan reject it, so those are matched in Python only.
+_QUERY_SAFE_VALUE = re.compile(r"[A-Za-z0-9_.+-]+")
+
+
+@dataclass(slots=True)
+class _PkgAgg:
+    """Per-name aggregate built while scanning search results in list_packages."""
+
+    latest_version: Version
+    total_versions: int
+    created: float | None
+
 
 def _load_recipe_metadata(conan_api: ConanAPI, ref: RecipeReference, remote) -> dict:
     """Read recipe-level attributes (description, license, homepage, ...) from a recipe.
@@ -92,8 +124,7 @@ async def list_packages(
 
     try:
         # Validate and get remote
-        validate_remote_name(conan_api, remote_name)
-        remote = get_remote_by_name(conan_api, remote_name)
+        remote = validate_remote_name(conan_api, remote_name)
 
         # The list view only needs recipe name/version metadata. Use a single
         # recipe search instead of list.select("*:*"), which enumerates every
@@ -103,45 +134,43 @@ async def list_packages(
         # NOTE: search_recipes returns references without revisions, so it can't be
         # read back via PackagesList.items() (that only yields refs with revisions).
         search_query = f"*{q}*" if q else "*"
-        refs = search_recipes(conan_api, search_query, remote=remote)
+        refs = await run_in_threadpool(search_recipes, conan_api, search_query, remote=remote)
 
         # Group recipe references by name in one pass, tracking newest version + count.
+        # Slotted _PkgAgg entries, not models: only the requested page is turned
+        # into ConanPackageInfo below.
         packages_dict = {}
-        latest_version_obj = {}
         for ref in refs:
-            name = ref.name
-
-            if name not in packages_dict:
-                packages_dict[name] = ConanPackageInfo(
-                    name=name,
-                    latest_version=str(ref.version),
-                    total_versions=1,
-                    created=ref.timestamp,
-                )
-                latest_version_obj[name] = ref.version
+            entry = packages_dict.get(ref.name)
+            if entry is None:
+                packages_dict[ref.name] = _PkgAgg(ref.version, 1, ref.timestamp)
             else:
-                info = packages_dict[name]
-                info.total_versions += 1
+                entry.total_versions += 1
                 # Compare Version objects (not strings) to find the newest.
-                if ref.version > latest_version_obj[name]:
-                    latest_version_obj[name] = ref.version
-                    info.latest_version = str(ref.version)
-                    info.created = ref.timestamp
+                if ref.version > entry.latest_version:
+                    entry.latest_version = ref.version
+                    entry.created = ref.timestamp
 
         # Apply search filter if specified
+        names = list(packages_dict)
         if q:
-            packages_dict = {name: pkg for name, pkg in packages_dict.items()
-                           if q.lower() in name.lower()}
-
-        # Convert to list and sort
-        packages_list = list(packages_dict.values())
-        packages_list.sort(key=lambda p: p.name.lower())
+            q_lower = q.lower()
+            names = [name for name in names if q_lower in name.lower()]
 
-        # Paginate results
-        total = len(packages_list)
+        # Sort and paginate
+        names.sort(key=str.lower)
+        total = len(names)
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
-        paginated_packages = packages_list[start_idx:end_idx]
+        paginated_packages = []
+        for name in names[start_idx:end_idx]:
+            entry = packages_dict[name]
+            paginated_packages.append(ConanPackageInfo(
+                name=name,
+                latest_version=str(entry.latest_version),
+                total_versions=entry.total_versions,
+                created=entry.created,
+            ))
 
         return PackagesListResponse(
             packages=paginated_packages,
@@ -168,57 +197,39 @@ async def get_package_versions(
 
     try:
         # Validate and get remote
-        validate_remote_name(conan_api, remote_name)
-        remote = get_remote_by_name(conan_api, remote_name)
+        remote = validate_remote_name(conan_api, remote_name)
 
-        # Create search pattern for this specific package
-        pattern = ListPattern(f"{package_name}/*:*", rrev=None, prev=None)
-          # Get package list using Conan API
-        package_list = conan_api.list.select(pattern, remote=remote)
+        # Latest recipe revision of every version/user/channel. Binaries aren't
+        # listed: a variant is a recipe reference, and enumerating packages would
+        # cost a configurations request per reference for nothing.
+        pattern = make_list_pattern(f"{package_name}/*", rrev="latest")
+        package_list = await run_in_threadpool(conan_api.list.select, pattern, remote=remote)
 
         # Group by version, then collect variants
-        versions_dict = {}
-        for ref, packages_info in package_list.items():
+        versions_dict = defaultdict(list)
+        for ref, _ in package_list.items():
             if ref.name == package_name:
-                version = ref.version
-
-                if version not in versions_dict:
-                    versions_dict[version] = []
-
-                # Get package variants (binaries) for this reference
-                for pref, pref_bundle in packages_info.items():
-                    variant = ConanPackageVariant(
-                        user=ref.user,
-                        channel=ref.channel,
-                        path=str(ref),
-                        created=ref.timestamp,
-                        size=None  # Size not easily available through Conan API
-                    )
-                    versions_dict[version].append(variant)
-
-                # If no packages, create a variant for the recipe itself
-                if not packages_info:
-                    variant = ConanPackageVariant(
-                        user=ref.user,
-                        channel=ref.channel,
-                        path=str(ref),
-                        created=ref.timestamp,
-                        size=None
-                    )
-                    versions_dict[version].append(variant)
+                variant = ConanPackageVariant(
+                    user=ref.user,
+                    channel=ref.channel,
+                    path=str(ref),
+                    created=ref.timestamp,
+                    size=None  # Size not easily available through Conan API
+                )
+                versions_dict[ref.version].append(variant)
 
-        # Convert to response format
+        # Convert to response format, newest first. The keys are Conan Version
+        # objects, which order semantically (1.10 > 1.9) and also cope with
+        # versions that aren't PEP 440, unlike a sort on the version strings.
         versions_list = []
-        for version, variants in versions_dict.items():
+        for version in sorted(versions_dict, reverse=True):
+            variants = versions_dict[version]
             versions_list.append(ConanPackageVersion(
                 version=str(version),
                 variants=variants,
                 total_variants=len(variants)
             ))
 
-        # Sort versions (simple string sort, could be improved with proper version sorting)
-        versions_list.sort(key=lambda v: v.version, reverse=True)
-
         return PackageVersionsResponse(
             package_name=package_name,
             versions=versions_list,
@@ -248,8 +259,7 @@ async def get_package_configuration(
 
     try:
         # Validate and get remote
-        validate_remote_name(conan_api, remote_name)
-        remote = get_remote_by_name(conan_api, remote_name)
+        remote = validate_remote_name(conan_api, remote_name)
 
         # Create reference
         ref = RecipeReference(package_name, version, user, channel)
@@ -260,7 +270,8 @@ async def get_package_configuration(
         else:
             # Try to get latest revision if not specified
             try:
-                ref_with_rev = conan_api.list.latest_recipe_revision(ref, remote=remote)
+                ref_with_rev = await run_in_threadpool(
+                    conan_api.list.latest_recipe_revision, ref, remote=remote)
                 if not ref_with_rev:
                     raise NotFoundException(f"Package {ref} not found")
                 ref = ref_with_rev
@@ -280,7 +291,8 @@ async def get_package_configuration(
 
         # Recipe-level metadata (description, license, homepage, ...) lives in the
         # conanfile, not the package config, so read it separately (best-effort).
-        for field, value in _load_recipe_metadata(conan_api, ref, remote).items():
+        metadata = await run_in_threadpool(_load_recipe_metadata, conan_api, ref, remote)
+        for field, value in metadata.items():
             setattr(detail, field, value)
 
         # This endpoint is only for actual binary packages with package IDs
@@ -289,7 +301,7 @@ async def get_package_configuration(
 
         # Get all package configurations for this recipe
         try:
-            pkg_configs = get_package_configurations(conan_api, ref, remote=remote)
+            pkg_configs = await get_cached_package_configurations(conan_api, ref, remote=remote)
             # Find the configuration for our specific package_id
             target_pref = None
             target_config = None
@@ -310,7 +322,8 @@ async def get_package_configuration(
                 # "Unknown"). Resolve the latest package revision to get the binary's
                 # actual creation/upload time.
                 try:
-                    latest_pref = conan_api.list.latest_package_revision(target_pref, remote=remote)
+                    latest_pref = await run_in_threadpool(
+                        conan_api.list.latest_package_revision, target_pref, remote=remote)
                     if latest_pref:
                         detail.created = latest_pref.timestamp
                         detail.package_revision = latest_pref.revision
@@ -349,63 +362,71 @@ async def get_package_filter_options(
 
     try:
         # Validate and get remote
-        validate_remote_name(conan_api, remote_name)
-        remote = get_remote_by_name(conan_api, remote_name)
-
-        # Create search pattern to get ALL binaries for this package version
-        base_pattern = f"{package_name}/{version}@*:*#*"
-        pattern = ListPattern(base_pattern, rrev=None, prev=None)
-
-        # Get all matching references
-        package_list = conan_api.list.select(pattern, remote=remote)
+        remote = validate_remote_name(conan_api, remote_name)
+
+        # The latest recipe revision for every user/channel of this package
+        # version (the same listing the binaries view uses). The options come
+        # from the package configurations fetched per revision below, so
+        # binaries are not listed here: listing their package revisions costs
+        # one request per binary and none of it is used.
+        recipe_refs = await get_cached_recipe_revisions(conan_api, package_name, version, remote=remote)
         # Extract all available filter options
         os_set = set()
         arch_set = set()
         compiler_set = set()
         build_type_set = set()
-        compiler_versions_map = {}
+        compiler_versions_map = defaultdict(set)
 
-        for ref, _packages_info in package_list.items():
-            if ref.name == package_name and ref.version == version:
-                # Get package configurations for this recipe to get settings
-                try:
-                    pkg_configs = get_package_configurations(conan_api, ref, remote=remote)
-
-                    for config_pref, config in pkg_configs.items():
-                        settings = config.get("settings", {})
-
-                        if settings.get("os"):
-                            os_set.add(settings["os"])
-                        if settings.get("arch"):
-                            arch_set.add(settings["arch"])
-                        if settings.get("compiler"):
-                            compiler = settings["compiler"]
-                            compiler_set.add(compiler)
-
-                            # Track compiler versions
-                            if settings.get("compiler.version"):
-                                if compiler not in compiler_versions_map:
-                                    compiler_versions_map[compiler] = set()
-                                compiler_versions_map[compiler].add(settings["compiler.version"])
-                        if settings.get("build_type"):
-                            build_type_set.add(settings["build_type"])
+        # Get package configurations for every recipe revision concurrently
+        fetch_slots = asyncio.Semaphore(_REMOTE_FETCH_CONCURRENCY)
 
+        async def fetch_configs(ref):
+            async with fetch_slots:
+                try:
+                    return await get_cached_package_configurations(conan_api, ref, remote=remote)
                 except Exception as e:
                     logger.warning(f"Could not get package configurations for {ref}: {e}")
-                    continue
+                    return {}
+
+        all_configs = await asyncio.gather(*(
+            fetch_configs(ref) for ref in recipe_refs
+            if ref.name == package_name and ref.version == version
+        ))
+
+        for pkg_configs in all_configs:
+            for config in pkg_configs.values():
+                get_setting = config.get("settings", {}).get
+                os_value = get_setting("os")
+                arch_value = get_setting("arch")
+                compiler = get_setting("compiler")
+                build_type_value = get_setting("build_type")
+
+                if os_value:
+                    os_set.add(os_value)
+                if arch_value:
+                    arch_set.add(arch_value)
+                if compiler:
+                    compiler_set.add(compiler)
+
+                    # Track compiler versions
+                    compiler_version = get_setting("compiler.version")
+                    if compiler_version:
+                        compiler_versions_map[compiler].add(compiler_version)
+                if build_type_value:
+                    build_type_set.add(build_type_value)
 
         # Convert sets to sorted lists
         filter_options = {
-            "os": sorted(list(os_set)),
-            "arch": sorted(list(arch_set)),
-            "compiler": sorted(list(compiler_set)),
-            "build_type": sorted(list(build_type_set))
+            "os": sorted(os_set),
+            "arch": sorted(arch_set),
+            "compiler": sorted(compiler_set),
+            "build_type": sorted(build_type_set)
         }
 
         # Convert compiler versions to sorted lists
-        compiler_versions = {}
-        for compiler, versions in compiler_versions_map.items():
-            compiler_versions[compiler] = sorted(list(versions))
+        compiler_versions = {
+            compiler: sorted(versions) for compiler, versions in compiler_versions_map.items()
+        }
 
         return PackageFilterOptionsResponse(
             package_name=package_name,
@@ -441,111 +462,140 @@ async def get_package_binaries(
 
     try:
         # Validate and get remote
-        validate_remote_name(conan_api, remote_name)
-        remote = get_remote_by_name(conan_api, remote_name)
-
-        # Create search pattern - search broadly first to get all revisions/users/channels
-        base_pattern = f"{package_name}/{version}@*:*#*"
-        pattern = ListPattern(base_pattern, rrev=None, prev=None)
-
-        # Get all matching references
-        package_list = conan_api.list.select(pattern, remote=remote)
-          # Collect all available revisions, users, and channels
-        all_revisions = set()
-        all_users = set()
-        all_channels = set()
-        all_refs = []
-
-        for ref, packages_info in package_list.items():
+        remote = validate_remote_name(conan_api, remote_name)
+
+        # Echoed back in every response; the success path fills in the resolved
+        # recipe revision below
+        filtered_by = {
+            "recipe_revision": recipe_revision,
+            "user": user,
+            "channel": channel,
+            "os": os,
+            "arch": arch,
+            "compiler": compiler,
+            "compiler_version": compiler_version,
+            "build_type": build_type
+        }
+
+        # List recipe revisions only (no binaries) across every user/channel: that
+        # is all the revision/user/channel selectors need. Binaries are listed
+        # below just for the references that pass the filters, instead of for
+        # every reference and then discarded.
+        recipe_refs = await get_cached_recipe_revisions(conan_api, package_name, version, remote=remote)
+        # Collect all available revisions, users, and channels, and in the same
+        # pass bucket the references matching the user/channel filters by
+        # revision: the revision filter needs the latest revision, known only
+        # afterwards, and then becomes a single lookup instead of another scan
+        all_revisions: set[str] = set()
+        all_users: set[str] = set()
+        all_channels: set[str] = set()
+        found = False
+        candidates_by_revision = defaultdict(list)
+
+        def matches_user_channel(ref):
+            return (user is None or ref.user == user) and (channel is None or ref.channel == channel)
+
+        for ref in recipe_refs:
             if ref.name == package_name and ref.version == version:
-                all_refs.append((ref, packages_info))
+                found = True
                 if ref.revision:
                     all_revisions.add(ref.revision)
                 if ref.user:
                     all_users.add(ref.user)
                 if ref.channel:
                     all_channels.add(ref.channel)
+                if matches_user_channel(ref):
+                    candidates_by_revision[ref.revision].append(ref)
 
-        if not all_refs:
+        if not found:
             return PackageBinariesResponse(
                 package_name=package_name,
                 version=version,
                 binaries=[],
-                revision_info=ConanRevisionInfo(
-                    recipe_revisions=[],
-                    users=[],
-                    channels=[],
-                    latest_revision=None
-                ),
+                revision_info=_EMPTY_REVISION_INFO,
                 total_binaries=0,
-                filtered_by={
-                    "recipe_revision": recipe_revision,
-                    "user": user,
-                    "channel": channel,
-                    "os": os,
-                    "arch": arch,
-                    "compiler": compiler,
-                    "compiler_version": compiler_version,
-                    "build_type": build_type
-                }
+                filtered_by=filtered_by,
             )
 
-        # Sort revisions to find latest (simple string sort for now)
-        sorted_revisions = sorted(all_revisions, reverse=True)
-        latest_revision = sorted_revisions[0] if sorted_revisions else None
+        # Latest revision by simple string order for now (the same order the
+        # response lists them in, sorted once below)
+        latest_revision = max(all_revisions) if all_revisions else None
 
         # Use latest revision if not specified
         target_revision = recipe_revision or latest_revision
+        filtered_by["recipe_revision"] = target_revision
 
-        # Filter references based on criteria
-        filtered_refs = []
-        for ref, packages_info in all_refs:
-            # Filter by revision
-            if target_revision and ref.revision != target_revision:
-                continue
-            # Filter by user
-            if user is not None and ref.user != user:
-                continue
-            # Filter by channel
-            if channel is not None and ref.channel != channel:
-                continue
-            filtered_refs.append((ref, packages_info))
-        # Get package binaries for filtered references
-        binaries = []
-        for ref, packages_info in filtered_refs:
-            # Get package configurations for this recipe to get settings/options
-            try:
-                pkg_configs = get_package_configurations(conan_api, ref, remote=remote)
-            except Exception as e:
-                logger.warning(f"Could not get package configurations for {ref}: {e}")
-                pkg_configs = {}
+        if recipe_revision:
+            # An explicit revision need not be the latest of every user/channel
+            # that has it (e.g. a link to an older revision): list just that
+            # revision rather than every revision of the version. The latest
+            # listing above still provides revision_info.
+            revision_refs = await get_cached_recipe_revisions(
+                conan_api, package_name, version, remote=remote, rrev=recipe_revision
+            )
+            filtered_refs = [ref for ref in revision_refs
+                             if ref.revision == recipe_revision and matches_user_channel(ref)]
+        else:
+            # Filter by revision (items() only yields references that carry one)
+            filtered_refs = candidates_by_revision.get(target_revision, [])
+
+        # Settings filters are checked against each binary below. The ones Conan
+        # can evaluate safely also go into its package query, so package
+        # revisions are only listed for the binaries that may match.
+        settings_filters = {
+            name: value for name, value in (
+                ("os", os),
+                ("arch", arch),
+                ("compiler", compiler),
+                ("compiler.version", compiler_version),
+                ("build_type", build_type),
+            ) if value
+        }
+        package_query = " AND ".join(
+            f'{name}="{value}"' for name, value in settings_filters.items()
+            if value != "None" and _QUERY_SAFE_VALUE.fullmatch(value)
+        ) or None
+
+        # Get package binaries for filtered references, fetching from the remote
+        # for several references at once
+        fetch_slots = asyncio.Semaphore(_REMOTE_FETCH_CONCURRENCY)
+
+        async def fetch_binaries(ref):
+            async with fetch_slots:
+                packages_info = await get_cached_package_revisions(
+                    conan_api, ref, remote=remote, package_query=package_query
+                )
 
+                # The listing carries each binary's settings/options itself. The
+                # configurations are only needed to tell "none match the filters"
+                # apart from "none at all" when it comes back empty.
+                pkg_configs = {}
+                if not packages_info and settings_filters:
+                    try:
+                        pkg_configs = await get_cached_package_configurations(conan_api, ref, remote=remote)
+                    except Exception as e:
+                        logger.warning(f"Could not get package configurations for {ref}: {e}")
+                return packages_info, pkg_configs
+
+        fetched = await asyncio.gather(*(fetch_binaries(ref) for ref in filtered_refs))
+
+        def ref_binaries(ref, packages_info, pkg_configs):
+            # str(pref) is str(pref.ref) + ":" + package_id, and every pref here
+            # belongs to `ref`: render the recipe part once per reference
+            ref_str = str(ref)
             if packages_info:
                 # We have actual binary packages
-                for pref, pref_bundle in packages_info.items():
-                    # Find the configuration for this specific package
-                    pkg_config = {}
-                    for config_pref, config in pkg_configs.items():
-                        if config_pref.package_id == pref.package_id:
-                            pkg_config = config
-                            break
-
-                    # Get settings for filtering
+                for pref, pkg_config in packages_info.items():
                     settings = pkg_config.get("settings", {})
 
-                    # Apply settings filters
-                    if os and settings.get("os") != os:
-                        continue
-                    if arch and settings.get("arch") != arch:
-                        continue
-                    if compiler and settings.get("compiler") != compiler:
-                        continue
-                    if compiler_version and settings.get("compiler.version") != compiler_version:
-                        continue
-                    if build_type and settings.get("build_type") != build_type:
+                    # The package query is only a pre-filter; this is the check
+                    # that decides
+                    if any(settings.get(name) != value for name, value in settings_filters.items()):
                         continue
 
-                    binary = ConanPackageBinary(
+                    # Everything below comes from Conan's own models, so skip
+                    # re-validating it field by field
+                    yield ConanPackageBinary.model_construct(
                         package_id=pref.package_id,
                         user=ref.user,
                         channel=ref.channel,
@@ -555,12 +605,12 @@ async def get_package_binaries(
                         options=pkg_config.get("options", {}),
                         requires=pkg_config.get("requires", []),
                         created=pref.timestamp,
-                        path=str(pref)
+                        path=f"{ref_str}:{pref.package_id}"
                     )
-                    binaries.append(binary)
-            else:
-                # No binary packages, create entry for recipe only
-                binary = ConanPackageBinary(
+            elif not (settings_filters and pkg_configs):
+                # No binary packages (rather than none matching the filters),
+                # create entry for recipe only
+                yield ConanPackageBinary.model_construct(
                     package_id="recipe-only",
                     user=ref.user,
                     channel=ref.channel,
@@ -570,34 +620,37 @@ async def get_package_binaries(
                     options={},
                     requires=[],
                     created=ref.timestamp,
-                    path=str(ref)
+                    path=ref_str
                 )
-                binaries.append(binary)
-          # Create revision info
+
+        # Create revision info
         revision_info = ConanRevisionInfo(
             recipe_revisions=sorted(all_revisions, reverse=True),
             users=sorted(all_users),
             channels=sorted(all_channels),
             latest_revision=latest_revision
         )
+        head = {
+            "package_name": package_name,
+            "version": version,
+            "revision_info": revision_info,
+            "filtered_by": filtered_by,
+        }
 
-        return PackageBinariesResponse(
-            package_name=package_name,
-            version=version,
-            binaries=binaries,
-            revision_info=revision_info,
-            total_binaries=len(binaries),
-            filtered_by={
-                "recipe_revision": target_revision,
-                "user": user,
-                "channel": channel,
-                "os": os,
-                "arch": arch,
-                "compiler": compiler,
-                "compiler_version": compiler_version,
-                "build_type": build_type
-            }
-        )
+        def stream_json():
+            # Same document as PackageBinariesResponse, written one recipe
+            # revision at a time so the full binaries list (and its JSON) is
+            # never held in memory at once; the count comes last.
+            yield to_json(head)[:-1] + b',"binaries":['
+            total = 0
+            for ref, (packages_info, pkg_configs) in zip(filtered_refs, fetched, strict=True):
+                chunk = [to_json(binary) for binary in ref_binaries(ref, packages_info, pkg_configs)]
+                if chunk:
+                    yield (b"," if total else b"") + b",".join(chunk)
+                    total += len(chunk)
+            yield b'],"total_binaries":%d}' % total
+
+        return StreamingResponse(stream_json(), media_type="application/json")
 
     except ConanException as e:
         logger.error(f"Conan API error: {str(e)}")
@@ -1,51 +1,28 @@
-#!/usr/bin/env python3
-"""
-Simple test script to verify the Conan API backend works
-"""
-
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from main import app  # noqa: F401  (imported to ensure the app assembles)
-from conan_client import get_all_remotes, get_optional_api
-
-def test_basic_functionality():
-    """Test basic Conan API functionality"""
-    print("🧪 Testing Conan API Backend...")
-
-    # Test 1: Check if Conan API is available
-    conan_api = get_optional_api()
-    print(f"✅ Conan API available: {bool(conan_api)}")
-
-    if not conan_api:
-        print("❌ Conan API not available - check Conan installation")
-        return False
-    
-    # Test 2: Check remotes
-    try:
-        remotes = get_all_remotes()
-        print(f"✅ Found {len(remotes)} configured remotes:")
-        for remote in remotes:
-            print(f"   - {remote.name}: {remote.url}")
-    except Exception as e:
-        print(f"⚠️  Error getting remotes: {e}")
-    
-    # Test 3: Test basic listing (this might take a moment)
-    try:
-        from conan.api.model import ListPattern
-        pattern = ListPattern("*", rrev=None, prev=None)
-        # Limit to local cache first, don't search remotes
-        package_list = conan_api.list.select(pattern, remote=None)
-        refs = list(package_list.refs().keys())
-        print(f"✅ Found {len(refs)} packages in local cache")
-        if refs:
-            print(f"   Example: {refs[0]}")
-    except Exception as e:
-        print(f"⚠️  Error listing packages: {e}")
-    
-    print("🎉 Basic test completed!")
-    return True
-
-if __name__ == "__main__":
-    test_basic_functionality()
+"""Smoke tests for the Conan API the backend is built on."""
+
+import pytest
+
+pytest.importorskip("conan")
+
+
+def test_app_assembles():
+    from main import app
+
+    paths = app.openapi()["paths"]
+    assert "/health" in paths
+    assert "/packages/{package_name}/{version}/binaries" in paths
+
+
+def test_conan_api_available(conan_api):
+    assert conan_api.cache_folder
+
+
+def test_remotes(remotes):
+    for remote in remotes:
+        assert remote.name
+        assert remote.url
+
+
+def test_local_cache_listing(package_list):
+    # A fresh Conan home has no recipes; the listing must still succeed.
+    assert list(package_list.serialize()) == []
@@ -8,7 +8,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-CONFIG_VARS = ("ARTIFACTORY_URL", "CONAN_REMOTES")
+CONFIG_VARS = ("ARTIFACTORY_URL", "CONAN_REMOTES", "CORS_ORIGINS", "CORS_ORIGIN_REGEX", "BACKEND_WORKERS")
 CRED_VARS = (
     "CONAN_LOGIN_USERNAME", "CONAN_PASSWORD",
     "CONAN_LOGIN_USERNAME_ALPHA", "CONAN_PASSWORD_ALPHA",
@@ -48,12 +48,14 @@ def test_first_remote_is_the_default(load_config):
     config = load_config(ARTIFACTORY_URL="https://art.example.com", CONAN_REMOTES="alpha,beta")
     assert config.DEFAULT_REMOTE == "alpha"
     assert [r["is_default"] for r in config.REPOSITORIES] == [True, False]
-    assert config.AVAILABLE_REMOTES == ["alpha", "beta"]
+    assert config.AVAILABLE_REMOTES == ("alpha", "beta")
+    assert config.AVAILABLE_REMOTES_SET == {"alpha", "beta"}
+    assert config.AVAILABLE_REMOTES_STR == "alpha, beta"
 
 
 def test_whitespace_and_blanks_are_tolerated(load_config):
     config = load_config(ARTIFACTORY_URL="https://art.example.com", CONAN_REMOTES=" alpha , , beta ")
-    assert config.AVAILABLE_REMOTES == ["alpha", "beta"]
+    assert config.AVAILABLE_REMOTES == ("alpha", "beta")
 
 
 def test_trailing_slash_on_base_url_does_not_double_up(load_config):
@@ -63,7 +65,7 @@ def test_trailing_slash_on_base_url_does_not_double_up(load_config):
 
 def test_duplicate_remote_names_are_dropped(load_config):
     config = load_config(ARTIFACTORY_URL="https://art.example.com", CONAN_REMOTES="alpha,alpha,beta")
-    assert config.AVAILABLE_REMOTES == ["alpha", "beta"]
+    assert config.AVAILABLE_REMOTES == ("alpha", "beta")
 
 
 def test_artifactory_api_base(load_config):
@@ -71,6 +73,27 @@ def test_artifactory_api_base(load_config):
     assert config.artifactory_api_base() == "https://art.example.com/artifactory"
 
 
+def test_settings_snapshot_is_read_once_and_frozen(load_config, monkeypatch):
+    import dataclasses
+    config = load_config(ARTIFACTORY_URL="https://art.example.com", CONAN_REMOTES="alpha")
+    monkeypatch.setenv("ARTIFACTORY_URL", "https://other.example.com")
+    assert config.settings.artifactory_url == "https://art.example.com"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.settings.artifactory_url = "https://other.example.com"
+
+
+def test_backend_workers_default_to_one(load_config):
+    assert load_config().settings.backend_workers == 1
+    assert load_config(BACKEND_WORKERS="4").settings.backend_workers == 4
+    assert load_config(BACKEND_WORKERS="0").settings.backend_workers == 1
+
+
+def test_cors_origins_are_trimmed(load_config):
+    config = load_config(CORS_ORIGINS=" http://a.example.com , ,http://b.example.com")
+    assert config.settings.cors_origins == ("http://a.example.com", "http://b.example.com")
+    assert config.settings.cors_origin_regex is None
+
+
 # --- Misconfiguration is non-fatal --------------------------------------------
 
 
@@ -176,3 +199,115 @@ def test_sync_removes_remotes_dropped_from_config(monkeypatch):
 
     assert removed == ["stale"]
     assert conan_client._managed_remotes == {"alpha"}
+
+
+def test_sync_sees_a_remote_it_just_added(monkeypatch):
+    """Cached remote lookups are invalidated when sync_remotes adds a remote."""
+    from conan.errors import ConanException
+
+    import conan_client
+    import config
+
+    monkeypatch.setenv("CONAN_LOGIN_USERNAME", "u")
+    monkeypatch.setenv("CONAN_PASSWORD", "p")
+    monkeypatch.setattr(config, "REPOSITORIES", [
+        {"name": "alpha", "url": "https://art.example.com/artifactory/api/conan/alpha"},
+    ])
+
+    registered = {}
+    logins = []
+
+    class FakeRemotes:
+        def add(self, remote): registered[remote.name] = remote
+        def update(self, name, url=None): pass
+        def remove(self, name): registered.pop(name, None)
+        def get(self, name):
+            if name not in registered:
+                raise ConanException(f"Remote '{name}' doesn't exist")
+            return registered[name]
+        def list(self): return list(registered.values())
+        def user_login(self, remote, user, password): logins.append(remote.name)
+
+    monkeypatch.setattr(conan_client, "conan_api", type("API", (), {"remotes": FakeRemotes()})())
+    monkeypatch.setattr(conan_client, "_managed_remotes", set())
+    monkeypatch.setattr(config, "AVAILABLE_REMOTES", ("alpha",))
+
+    api = conan_client.conan_api
+    assert conan_client.get_supported_remotes(api)[0]["available"] is False
+    assert conan_client.get_all_remotes() == []
+
+    assert conan_client.sync_remotes() == []
+    assert logins == ["alpha"]
+    assert conan_client.get_remote_by_name(api, "alpha") is registered["alpha"]
+    assert conan_client.get_supported_remotes(api)[0]["available"] is True
+    assert conan_client.get_all_remotes() == [registered["alpha"]]
+    assert conan_client.get_supported_remotes(api) is conan_client.get_supported_remotes(api)
+
+
+# --- Configuration cache ------------------------------------------------------
+
+
+def test_package_configurations_are_fetched_once_per_revision(monkeypatch):
+    import asyncio
+
+    from conan.api.model import RecipeReference
+
+    import conan_client
+
+    calls = []
+
+    def fake_get(conan_api, ref, remote=None):
+        calls.append(ref.repr_notime())
+        return {"pkg": {"settings": {"os": "Linux"}}}
+
+    monkeypatch.setattr(conan_client, "get_package_configurations", fake_get)
+    conan_client.clear_package_caches()
+    remote = type("R", (), {"name": "alpha"})()
+    ref = RecipeReference.loads("zlib/1.3#abc")
+
+    async def fetch_concurrently():
+        return await asyncio.gather(*(
+            conan_client.get_cached_package_configurations(None, ref, remote) for _ in range(3)
+        ))
+
+    results = asyncio.run(fetch_concurrently())
+    assert calls == ["zlib/1.3#abc"]
+    assert all(r == {"pkg": {"settings": {"os": "Linux"}}} for r in results)
+
+    conan_client.clear_package_caches()
+    asyncio.run(conan_client.get_cached_package_configurations(None, ref, remote))
+    assert len(calls) == 2
+
+
+def test_listings_are_cached_per_remote_and_version(monkeypatch):
+    import asyncio
+
+    import conan_client
+
+    calls = []
+
+    def fake_list(conan_api, package_name, version, remote=None, rrev="latest"):
+        calls.append((remote.name, package_name, version))
+        return []
+
+    monkeypatch.setattr(conan_client, "list_recipe_revisions", fake_list)
+    conan_client.clear_package_caches()
+    alpha = type("R", (), {"name": "alpha"})()
+    beta = type("R", (), {"name": "beta"})()
+
+    for remote in (alpha, alpha, beta):
+        asyncio.run(conan_client.get_cached_recipe_revisions(None, "zlib", "1.3", remote))
+    assert calls == [("alpha", "zlib", "1.3"), ("beta", "zlib", "1.3")]
+
+    conan_client.clear_package_caches()
+    asyncio.run(conan_client.get_cached_recipe_revisions(None, "zlib", "1.3", alpha))
+    assert len(calls) == 3
+
+
+def test_list_patterns_are_shared_between_identical_queries():
+    import conan_client
+
+    first = conan_client.make_list_pattern("zlib/*", rrev=None)
+    assert conan_client.make_list_pattern("zlib/*", rrev=None) is first
+    assert conan_client.make_list_pattern("zlib/*") is not first
+    assert (first.name, first.version, first.rrev) == ("zlib", "*", None)
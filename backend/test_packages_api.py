@@ -0,0 +1,158 @@
+"""Tests for the package browsing endpoints, against an in-memory remote."""
+
+import pytest
+
+pytest.importorskip("conan")
+
+from conan.api.model import PkgReference, RecipeReference  # noqa: E402
+from conan.internal.api.list.query_parse import filter_package_configs  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import conan_client  # noqa: E402
+import main  # noqa: E402
+from routers import packages  # noqa: E402
+from schemas import PackageBinariesResponse  # noqa: E402
+
+BINARIES_URL = "/packages/zlib/1.3/binaries"
+
+
+class FakeRemote:
+    """What the listing helpers in conan_client would read from a remote.
+
+    `binaries` maps a recipe reference ("zlib/1.3@user/channel#rrev") to
+    {package_id: settings}; a reference with no entries has no binaries.
+    """
+
+    name = "alpha"
+
+    def __init__(self, binaries):
+        self.binaries = binaries
+
+    def recipe_revisions(self, conan_api, package_name, version, remote=None, rrev="latest"):
+        refs = [RecipeReference.loads(ref) for ref in self.binaries]
+        for ref in refs:
+            ref.timestamp = 1700000000.0
+        if rrev == "latest":
+            latest = {}
+            for ref in refs:
+                key = (ref.user, ref.channel)
+                if key not in latest or ref.revision > latest[key].revision:
+                    latest[key] = ref
+            return list(latest.values())
+        return [ref for ref in refs if ref.revision == rrev]
+
+    def configurations(self, conan_api, ref, remote=None):
+        return {
+            PkgReference(ref, package_id): {"settings": dict(settings), "options": {}}
+            for package_id, settings in self.binaries.get(ref.repr_notime(), {}).items()
+        }
+
+    def package_revisions(self, conan_api, ref, remote=None, package_query=None):
+        # Conan's own query evaluation, so a malformed query fails here as it
+        # would against a real remote
+        configs = filter_package_configs(self.configurations(conan_api, ref), package_query)
+        return {
+            PkgReference(ref, pref.package_id, "p" + pref.package_id, 1700000000.0): info
+            for pref, info in configs.items()
+        }
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Serve the binaries endpoint from a FakeRemote built from `binaries`."""
+
+    def install(binaries):
+        remote = FakeRemote(binaries)
+        monkeypatch.setattr(conan_client, "list_recipe_revisions", remote.recipe_revisions)
+        monkeypatch.setattr(conan_client, "get_package_configurations", remote.configurations)
+        monkeypatch.setattr(conan_client, "list_package_revisions", remote.package_revisions)
+        monkeypatch.setattr(packages, "validate_remote_name", lambda conan_api, name: remote)
+        conan_client.clear_package_caches()
+        return TestClient(main.app)
+
+    main.app.dependency_overrides[conan_client.get_conan_api] = lambda: object()
+    yield install
+    main.app.dependency_overrides.clear()
+    conan_client.clear_package_caches()
+
+
+LINUX_AND_WINDOWS = {
+    "zlib/1.3@user/stable#r1": {
+        "linux": {"os": "Linux", "build_type": "Release"},
+        "windows": {"os": "Windows", "build_type": "Release"},
+    },
+}
+
+
+def test_settings_filters_select_binaries(serve):
+    client = serve(LINUX_AND_WINDOWS)
+
+    body = client.get(BINARIES_URL, params={"remote_name": "alpha", "os": "Linux"}).json()
+    assert [b["package_id"] for b in body["binaries"]] == ["linux"]
+    assert body["filtered_by"]["os"] == "Linux"
+
+
+@pytest.mark.parametrize("value", ['Rel"ease', 'Release" OR os="Nope', "Linux!", "None", "Release OR os"])
+def test_settings_filter_values_are_not_parsed_as_query_syntax(serve, value):
+    client = serve(LINUX_AND_WINDOWS)
+
+    response = client.get(BINARIES_URL, params={"remote_name": "alpha", "build_type": value})
+    assert response.status_code == 200
+    assert response.json()["binaries"] == []
+    assert response.json()["total_binaries"] == 0
+
+
+def test_binaries_uploaded_after_configurations_were_cached_show_up(serve):
+    binaries = {"zlib/1.3@user/stable#r1": {"linux": {"os": "Linux"}}}
+    client = serve(binaries)
+    params = {"remote_name": "alpha"}
+    assert client.get("/packages/zlib/1.3/filter-options", params=params).json()["filter_options"]["os"] == ["Linux"]
+
+    # A new binary for the same recipe revision, once the listings (but not
+    # the configurations) have expired
+    binaries["zlib/1.3@user/stable#r1"]["windows"] = {"os": "Windows"}
+    conan_client._listings_cache.clear()
+
+    body = client.get(BINARIES_URL, params=params).json()
+    assert {b["package_id"]: b["settings"] for b in body["binaries"]} == {
+        "linux": {"os": "Linux"},
+        "windows": {"os": "Windows"},
+    }
+    options = client.get("/packages/zlib/1.3/filter-options", params=params).json()
+    assert options["filter_options"]["os"] == ["Linux", "Windows"]
+
+
+def test_explicit_revision_lists_every_user_channel_that_has_it(serve):
+    # r1 is still the latest for user2 but was superseded for user1
+    client = serve({
+        "zlib/1.3@user1/stable#r1": {"old": {"os": "Linux"}},
+        "zlib/1.3@user1/stable#r2": {"new": {"os": "Linux"}},
+        "zlib/1.3@user2/stable#r1": {"other": {"os": "Linux"}},
+    })
+
+    body = client.get(BINARIES_URL, params={"remote_name": "alpha", "recipe_revision": "r1"}).json()
+    assert sorted((b["path"], b["recipe_revision"]) for b in body["binaries"]) == [
+        ("zlib/1.3@user1/stable:old", "r1"),
+        ("zlib/1.3@user2/stable:other", "r1"),
+    ]
+    assert body["revision_info"]["recipe_revisions"] == ["r2", "r1"]
+
+
+@pytest.mark.parametrize("binaries, total", [
+    pytest.param({}, 0, id="empty-listing"),
+    pytest.param({"zlib/1.3@user/stable#r1": {"linux": {"os": "Linux"}}}, 1, id="one-reference"),
+    pytest.param({
+        "zlib/1.3@user/stable#r1": {"linux": {"os": "Linux"}, "linux-debug": {"os": "Linux"}},
+        "zlib/1.3@user/testing#r1": {"windows": {"os": "Windows"}},
+        "zlib/1.3@other/stable#r1": {"windows": {"os": "Windows"}},
+        "zlib/1.3@user/beta#r1": {"linux": {"os": "Linux"}},
+    }, 3, id="references-without-rows"),
+])
+def test_streamed_binaries_parse_as_the_response_model(serve, binaries, total):
+    client = serve(binaries)
+
+    response = client.get(BINARIES_URL, params={"remote_name": "alpha", "os": "Linux"})
+    assert response.status_code == 200
+    parsed = PackageBinariesResponse.model_validate(response.json())
+    assert parsed.total_binaries == len(parsed.binaries) == total
+    assert all(binary.settings == {"os": "Linux"} for binary in parsed.binaries)